@@ -1,6 +1,6 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import requests
 import nh3
 
@@ -18,13 +18,23 @@ st.info(
 )
 
 
+@st.cache_resource
+def get_http_session():
+    """
+    Shared requests.Session so API calls reuse pooled keep-alive
+    connections instead of opening a new TCP connection per request.
+    """
+    return requests.Session()
+
+
 @st.cache_data
 def login_to_api(username, password, api_url="http://localhost:8000/token"):
     """
     Obtain JWT token from FastAPI backend.
     """
     try:
-        response = requests.post(api_url, data={"username": username, "password": password})
+        session = get_http_session()
+        response = session.post(api_url, data={"username": username, "password": password})
         response.raise_for_status()
         return response.json()["access_token"]
     except requests.RequestException as e:
@@ -39,15 +49,18 @@ def fetch_api_data(token, api_url="http://localhost:8000/tracts/"):
     """
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(api_url, headers=headers)
+        response = get_http_session().get(api_url, headers=headers)
         response.raise_for_status()
         data = response.json()
 
-        # Sanitize census_tract strings
-        for item in data:
-            item["census_tract"] = nh3.clean(item["census_tract"])
-
-        return pd.DataFrame(data)
+        df = pd.DataFrame(data)
+        if not df.empty:
+            # Sanitize census_tract strings column-wise, once per unique value
+            tracts = df["census_tract"]
+            df["census_tract"] = tracts.map(
+                {v: nh3.clean(v) for v in tracts.unique()}
+            ).astype("category")  # integer codes make later filters cheap
+        return df
     except requests.RequestException as e:
         st.error(f"API error: {str(e)}")
         return None
@@ -75,8 +88,9 @@ if df is None or df.empty:
     st.warning("No data available.")
     st.stop()
 
-# Data structure: list of unique census tracts
-tract_list = sorted(list(df["census_tract"].unique()))
+# Data structure: list of unique census tracts (the categorical's
+# categories are already unique and lexicographically sorted)
+tract_list = df["census_tract"].cat.categories.tolist()
 st.write(f"Available Census Tracts: {tract_list}")
 
 # --- Sidebar Filters ---
@@ -99,6 +113,10 @@ with col1:
 with col2:
     st.subheader("Inclusion vs. Growth")
     if not filtered_df.empty:
+        # Deferred import: plotly only loads once a logged-in user reaches
+        # the charts, keeping it off the login-screen cold-start path.
+        import plotly.express as px
+
         fig = px.scatter(
             filtered_df,
             x="inclusion_score",
@@ -115,58 +133,57 @@ with col2:
 st.markdown("---")
 st.subheader("Average Scores: Low-Income vs High-Income Tracts")
 
-low_income_tracts = {
+low_income_tracts = frozenset({
     "06037102107",  # Los Angeles, Skid Row
     "06065045117",  # Riverside, low-income urban
     "06059099251",  # Orange County, Santa Ana
     "06001400300",  # Alameda, Oakland inner city
     "06073008339",  # San Diego, City Heights
-}
+})
 
-high_income_tracts = {
+high_income_tracts = frozenset({
     "06085511712",  # Santa Clara, Palo Alto
     "06075010200",  # San Francisco, Pacific Heights
     "06041110100",  # Marin, Mill Valley
     "06013355102",  # Contra Costa, Danville
     "06059062610",  # Orange County, Newport Beach
-}
-
-# Use list comprehensions to get inclusion scores by group
-low_inclusion_scores = [
-    row.inclusion_score
-    for _, row in df.iterrows()
-    if row.census_tract in low_income_tracts
-]
-
-high_inclusion_scores = [
-    row.inclusion_score
-    for _, row in df.iterrows()
-    if row.census_tract in high_income_tracts
-]
-
-def safe_avg(values):
-    return sum(values) / len(values) if values else 0
-
-avg_df = pd.DataFrame(
-    {
-        "group": ["Low Income", "High Income"],
-        "avg_inclusion_score": [
-            safe_avg(low_inclusion_scores),
-            safe_avg(high_inclusion_scores),
-        ],
-    }
-)
-
-fig_bar = px.bar(
-    avg_df,
-    x="group",
-    y="avg_inclusion_score",
-    title="Average Inclusion Score: Low vs High Income Tracts",
-)
-st.plotly_chart(fig_bar, use_container_width=True)
-
-st.caption(
-    "This comparison highlights potential socioeconomic bias: "
-    "if high-income tracts consistently have higher inclusion scores, "
-    "decisions based solely on these scores may reinforce existing inequalities."
-)
+})
+
+with st.expander("Compare low- vs high-income tracts"):
+    import plotly.express as px
+
+    # Vectorized group averages: membership is resolved once against the
+    # categorical's categories, then the row masks are pure integer-code
+    # comparisons rather than per-row string hashing.
+    tract_cat = df["census_tract"].cat
+    low_codes = tract_cat.categories.get_indexer(sorted(low_income_tracts))
+    high_codes = tract_cat.categories.get_indexer(sorted(high_income_tracts))
+
+    codes = tract_cat.codes.to_numpy()
+    mask_low = np.isin(codes, low_codes[low_codes >= 0])
+    mask_high = np.isin(codes, high_codes[high_codes >= 0])
+
+    scores = df["inclusion_score"].to_numpy()
+    avg_low = scores[mask_low].mean() if mask_low.any() else 0.0
+    avg_high = scores[mask_high].mean() if mask_high.any() else 0.0
+
+    avg_df = pd.DataFrame(
+        {
+            "group": ["Low Income", "High Income"],
+            "avg_inclusion_score": [avg_low, avg_high],
+        }
+    )
+
+    fig_bar = px.bar(
+        avg_df,
+        x="group",
+        y="avg_inclusion_score",
+        title="Average Inclusion Score: Low vs High Income Tracts",
+    )
+    st.plotly_chart(fig_bar, use_container_width=True)
+
+    st.caption(
+        "This comparison highlights potential socioeconomic bias: "
+        "if high-income tracts consistently have higher inclusion scores, "
+        "decisions based solely on these scores may reinforce existing inequalities."
+    )
@@ -0,0 +1,32 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from database import init_db
+from main import app, create_access_token
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed_database():
+    """
+    Seed the SQLite DB once per test session; init_db() used to run at
+    import time but is now gated behind the app startup hook.
+    """
+    init_db()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared unauthenticated TestClient for the whole session."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_client():
+    """
+    TestClient with a single pre-built admin token in its default headers,
+    so each test skips the per-call token encode and client setup.
+    """
+    token = create_access_token({"sub": "admin"})
+    c = TestClient(app)
+    c.headers.update({"Authorization": f"Bearer {token}"})
+    return c
@@ -1,10 +1,4 @@
-from fastapi.testclient import TestClient
-from main import app, create_access_token
-
-client = TestClient(app)
-
-
-def test_login_success():
+def test_login_success(client):
     response = client.post(
         "/token", data={"username": "admin", "password": "securepassword123"}
     )
@@ -14,15 +8,13 @@ def test_login_success():
     assert data["token_type"] == "bearer"
 
 
-def test_get_tracts_unauthorized():
+def test_get_tracts_unauthorized(client):
     response = client.get("/tracts/")
     assert response.status_code == 401
 
 
-def test_get_tracts_authorized():
-    token = create_access_token({"sub": "admin"})
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/tracts/", headers=headers)
+def test_get_tracts_authorized(auth_client):
+    response = auth_client.get("/tracts/")
     assert response.status_code == 200
     tracts = response.json()
     assert isinstance(tracts, list)
@@ -37,22 +29,17 @@ def test_get_tracts_authorized():
     assert required_keys.issubset(set(tracts[0].keys()))
 
 
-def test_get_single_tract_authorized():
-    token = create_access_token({"sub": "admin"})
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_get_single_tract_authorized(auth_client):
     # Use a known census tract from igs_data.csv
     tract_id = "06037102107"
-    response = client.get(f"/tracts/{tract_id}", headers=headers)
+    response = auth_client.get(f"/tracts/{tract_id}")
 
     assert response.status_code == 200
     data = response.json()
     assert data["census_tract"] == tract_id
 
 
-def test_users_me():
-    token = create_access_token({"sub": "admin"})
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/users/me", headers=headers)
+def test_users_me(auth_client):
+    response = auth_client.get("/users/me")
     assert response.status_code == 200
     assert response.json()["username"] == "admin"